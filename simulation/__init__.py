@@ -2,12 +2,13 @@
 SimPy Discrete-Event Simulation (DES) Model.
 """
 
-__version__ = "1.2.0"
+__version__ = "2.0.0.dev0"
 
 
 # This section allows us to import using e.g. `from simulation import Model`,
 # rather than `from simulation.model import Model`.
 
+from .bufferedexponential import BufferedExponential
 from .confidence_interval_method_simple import (
     confidence_interval_method_simple)
 from .confidence_interval_method import confidence_interval_method
@@ -15,7 +16,6 @@ from .model import Model
 from .monitoredresource import MonitoredResource
 from .onlinestatistics import OnlineStatistics
 from .param import Param
-from .patient import Patient
 from .plotly_confidence_interval_method import (
     plotly_confidence_interval_method)
 from .replicationsalgorithm import ReplicationsAlgorithm
@@ -23,21 +23,24 @@ from .replicationtabulizer import ReplicationTabulizer
 from .run_scenarios import run_scenarios
 from .runner import Runner
 from .simlogger import SimLogger
-from .summary_stats import summary_stats
+from .summary_stats import (
+    cumulative_summary_stats, summary_stats, summary_stats_table)
 
 __all__ = [
+    "BufferedExponential",
     "confidence_interval_method_simple",
     "confidence_interval_method",
+    "cumulative_summary_stats",
     "Model",
     "MonitoredResource",
     "OnlineStatistics",
     "Param",
-    "Patient",
     "plotly_confidence_interval_method",
     "ReplicationsAlgorithm",
     "ReplicationTabulizer",
     "run_scenarios",
     "Runner",
     "SimLogger",
-    "summary_stats"
+    "summary_stats",
+    "summary_stats_table"
 ]
@@ -0,0 +1,27 @@
+"""
+Internal helpers shared between modules (not part of the package API).
+"""
+
+import numpy as np
+
+
+def concat_columns(results):
+    """
+    Join dictionaries of arrays (e.g. from each run or metric), column by
+    column.
+
+    This is quicker than creating a dataframe from each dictionary and
+    joining them with pd.concat().
+
+    Parameters
+    ----------
+    results : list
+        List of dictionaries, each mapping column names to arrays.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping each column name to a single joined array.
+    """
+    return {column: np.concatenate([result[column] for result in results])
+            for column in results[0]}
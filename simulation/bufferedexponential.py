@@ -0,0 +1,88 @@
+"""
+BufferedExponential.
+"""
+
+import numpy as np
+from sim_tools.distributions import Exponential
+
+
+class BufferedExponential(Exponential):
+    """
+    Exponential distribution which draws samples in bulk and serves them one
+    at a time.
+
+    Sampling a single value from NumPy has a fixed Python-level overhead, so
+    drawing one value per event in the simulation is slow. Instead, this
+    draws a chunk of samples in one call and returns them one by one,
+    refilling when the chunk is used up. As each distribution has its own
+    random number stream, the sequence of values returned is identical to
+    calling `sample()` once per event. The buffer is allocated once and
+    refilled in place, by drawing standard exponential values and scaling
+    them by the mean (which gives the same values as drawing with the mean).
+
+    Attributes
+    ----------
+    _buf : np.ndarray
+        Pre-drawn samples.
+    _idx : int
+        Position of the next sample to return from the buffer.
+    _chunk : int
+        Number of samples to draw each time the buffer is refilled.
+    """
+
+    def __init__(self, mean, random_seed=None, chunk=1 << 16):
+        """
+        Initialise the distribution.
+
+        Parameters
+        ----------
+        mean : float
+            The mean of the exponential distribution.
+        random_seed : int|np.random.SeedSequence, optional
+            Random seed or SeedSequence to reproduce samples.
+        chunk : int, optional
+            Number of samples to draw each time the buffer is refilled.
+        """
+        super().__init__(mean=mean, random_seed=random_seed)
+        self._buf = np.empty(chunk)
+        self._idx = chunk
+        self._chunk = chunk
+
+    def sample(self, size=None):
+        """
+        Generate random samples from the exponential distribution.
+
+        Single samples are taken from the pre-drawn buffer. Arrays of samples
+        are drawn directly from the random number generator, so a model
+        should use one approach or the other for a given distribution.
+
+        Parameters
+        ----------
+        size : int|tuple, optional
+            Number/shape of samples to generate. If None, returns one sample.
+
+        Returns
+        -------
+        float|np.ndarray
+            Sample(s) from the exponential distribution.
+        """
+        if size is None:
+            return self.sample_one()
+        return super().sample(size=size)
+
+    def sample_one(self):
+        """
+        Return a single sample, taken from the pre-drawn buffer.
+
+        Returns
+        -------
+        float
+            Sample from the exponential distribution.
+        """
+        if self._idx >= self._chunk:
+            self.rng.standard_exponential(out=self._buf)
+            self._buf *= self.mean
+            self._idx = 0
+        value = self._buf[self._idx]
+        self._idx += 1
+        return float(value)
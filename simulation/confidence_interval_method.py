@@ -7,17 +7,16 @@ This code is adapted from Tom Monks (2021) sim-tools: fundamental tools to
 support the simulation process in python
 (https://github.com/TomMonks/sim-tools) (MIT Licence).
 """
-# pylint: disable=duplicate-code
 
 import warnings
 
 import numpy as np
 import pandas as pd
 
+from ._utils import concat_columns
 from .param import Param
 from .runner import Runner
-from .replicationtabulizer import ReplicationTabulizer
-from .onlinestatistics import OnlineStatistics
+from .summary_stats import cumulative_summary_stats
 
 
 # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
@@ -37,6 +36,7 @@ def confidence_interval_method(
     calculates the cumulative mean and confidence intervals for each
     replication, and determines when the desired precision is first achieved
     for each metric. It does not check if this precision is maintained.
+    The cumulative statistics are calculated with cumulative_summary_stats().
 
     Parameters
     ----------
@@ -88,34 +88,32 @@ def confidence_interval_method(
     summary_table_list = []
 
     for metric in metrics:
-        # Extract replication results for the specified metric
-        rep_res = choose_rep.run_results_df[metric]
-
-        # Set up method for calculating statistics and saving them as a table
-        observer = ReplicationTabulizer()
-        stats = OnlineStatistics(
-            alpha=alpha, data=np.array(rep_res[:2]), observer=observer
-        )
-
-        # Calculate statistics with each replication, and get summary table
-        for i in range(2, len(rep_res)):
-            stats.update(rep_res[i])
-
-        results = observer.summary_table()
+        # Calculate statistics with each replication, as a summary table
+        data = choose_rep.run_results_df[metric]
+        stats = cumulative_summary_stats(data, alpha=alpha)
+        mean = stats["mean"].to_numpy()
+        upper_ci = stats["upper_ci"].to_numpy()
+        results = {
+            "replications": np.arange(1, replications + 1),
+            "data": data.to_numpy(),
+            "cumulative_mean": mean,
+            "stdev": stats["std_dev"].to_numpy(),
+            "lower_ci": stats["lower_ci"].to_numpy(),
+            "upper_ci": upper_ci,
+            "deviation": (upper_ci - mean) / mean
+        }
 
         # Get minimum number of replications where deviation is below target
-        try:
-            nreps = (
-                results
-                .loc[results["replications"] >= min_rep]
-                .loc[results["deviation"] <= desired_precision]
-                .iloc[0]
-                .replications
-            )
+        meets = (
+            (results["replications"] >= min_rep) &
+            (results["deviation"] <= desired_precision)
+        )
+        if meets.any():
+            nreps = int(results["replications"][meets.argmax()])
             if verbose:
                 print(f"{metric}: Reached desired precision in {nreps} " +
                       "replications.")
-        except IndexError:
+        else:
             message = f"WARNING: {metric} does not reach desired precision."
             warnings.warn(message)
             nreps = None
@@ -124,10 +122,13 @@ def confidence_interval_method(
         nreps_dict[metric] = nreps
 
         # Add metric name to table then append to list
-        results["metric"] = metric
+        results["metric"] = np.repeat(metric, replications)
         summary_table_list.append(results)
 
-    # Combine into a single table
-    summary_frame = pd.concat(summary_table_list)
+    # Combine into a single table, indexed by replication within each metric
+    summary_frame = pd.DataFrame(
+        concat_columns(summary_table_list),
+        index=np.tile(np.arange(replications), len(metrics))
+    )
 
     return nreps_dict, summary_frame
@@ -1,15 +1,9 @@
 """
 confidence_interval_method_simple.
 """
-# pylint: disable=duplicate-code
-
-import warnings
-
-import pandas as pd
 
+from .confidence_interval_method import confidence_interval_method
 from .param import Param
-from .runner import Runner
-from .summary_stats import summary_stats
 
 
 # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -22,13 +16,11 @@ def confidence_interval_method_simple(
     verbose=False
 ):
     """
-    Simple implementation using the confidence interval method to select the
-    number of replications.
+    Simple interface to the confidence interval method for selecting the
+    number of replications, which always uses a 95% confidence interval.
 
-    This produces the same results as confidence_interval_method(), but depends
-    on summary_stats() instead of ReplicationTabulizer and OnlineStatistics.
-    We provide both confidence interval functions to give examples on a few
-    ways you could do this analysis.
+    This is confidence_interval_method() with alpha=0.05, so gives the same
+    results.
 
     Parameters
     ----------
@@ -62,63 +54,12 @@ def confidence_interval_method_simple(
     Issues a warning if the desired precision is not met within the
     provided replications.
     """
-    # Replace runs in param with the specified number of replications
-    param.number_of_runs = replications
-
-    # Run the model
-    choose_rep = Runner(param)
-    choose_rep.run_reps()
-    df = choose_rep.run_results_df
-
-    nreps_dict = {}
-    summary_table_list = []
-
-    for metric in metrics:
-        # Compute cumulative statistics
-        cumulative = pd.DataFrame([
-            {
-                "replications": i + 1,  # Adjusted as counted from zero
-                "data": df[metric][i],
-                "cumulative_mean": stats[0],
-                "stdev": stats[1],
-                "lower_ci": stats[2],
-                "upper_ci": stats[3],
-                "deviation": (stats[3] - stats[0]) / stats[0]
-            }
-            for i, stats in enumerate(
-                (summary_stats(df[metric].iloc[:i])
-                 for i in range(1, replications + 1))
-            )
-        ])
-
-        # Get minimum number of replications where deviation is below target
-        try:
-            nreps = (
-                cumulative
-                .loc[cumulative["replications"] >= min_rep]
-                .loc[cumulative["deviation"] <= desired_precision]
-                .iloc[0]
-                .replications
-            )
-            if verbose:
-                print(f"{metric}: Reached desired precision in {nreps} " +
-                      "replications.")
-        # Return warning if there are no replications with desired precision
-        except IndexError:
-            warnings.warn(
-                f"Running {replications} replications did not reach desired "
-                f"precision ({desired_precision}) for metric {metric}."
-            )
-            nreps = None
-
-        # Add solution to dictionary
-        nreps_dict[metric] = nreps
-
-        # Add metric name to table then append to list
-        cumulative["metric"] = metric
-        summary_table_list.append(cumulative)
-
-    # Combine into a single table
-    summary_frame = pd.concat(summary_table_list)
-
-    return nreps_dict, summary_frame
+    return confidence_interval_method(
+        replications=replications,
+        metrics=metrics,
+        param=param,
+        alpha=0.05,
+        desired_precision=desired_precision,
+        min_rep=min_rep,
+        verbose=verbose
+    )
@@ -8,12 +8,78 @@ little book of DES (https://github.com/hsma-programme/hsma6_des_book)
 (MIT Licence).
 """
 
+import heapq
+
 import numpy as np
 import simpy
-from sim_tools.distributions import Exponential
 
+from .bufferedexponential import BufferedExponential
 from .monitoredresource import MonitoredResource
-from .patient import Patient
+
+# Parameters checked by Model.valid_inputs(), which must be greater than 0
+# and greater than or equal to 0 respectively
+_POSITIVE_PARAMS = (
+    "patient_inter", "mean_n_consult_time", "number_of_runs",
+    "audit_interval", "number_of_nurses"
+)
+_NON_NEGATIVE_PARAMS = ("warm_up_period", "data_collection_period")
+
+
+def _simulate_core(arrival_time, time_with_nurse, capacity):
+    """
+    Find the time each patient starts their consultation, when patients are
+    seen first come, first served by a given number of nurses.
+
+    This uses a heap containing the time at which each nurse will next be
+    free. A patient is seen on arrival if a nurse is free, or otherwise as soon
+    as the first nurse becomes free. Two common cases are handled without the
+    heap: when there are at least as many nurses as patients (so no-one
+    waits), and when there is a single nurse (so each patient is seen once
+    the previous patient has finished).
+
+    Parameters
+    ----------
+    arrival_time : np.ndarray
+        Arrival time of each patient, in order of arrival.
+    time_with_nurse : np.ndarray
+        Consultation length for each patient.
+    capacity : int
+        Number of nurses.
+
+    Returns
+    -------
+    np.ndarray
+        Time each patient starts their consultation.
+    """
+    # Enough nurses for every patient to be seen on arrival
+    if capacity >= len(arrival_time):
+        return arrival_time.copy()
+
+    # Looping over Python floats with locally bound functions is much quicker
+    # than indexing NumPy arrays one element at a time
+    start_time = []
+    if capacity == 1:
+        nurse_free = 0
+        for arrival, consult in zip(arrival_time.tolist(),
+                                    time_with_nurse.tolist()):
+            start = max(arrival, nurse_free)
+            nurse_free = start + consult
+            start_time.append(start)
+        return np.array(start_time, dtype=float)
+
+    heappush = heapq.heappush
+    heapreplace = heapq.heapreplace
+    nurse_free = []
+    for arrival, consult in zip(arrival_time.tolist(),
+                                time_with_nurse.tolist()):
+        if len(nurse_free) < capacity:
+            start = arrival
+            heappush(nurse_free, arrival + consult)
+        else:
+            start = max(arrival, nurse_free[0])
+            heapreplace(nurse_free, start + consult)
+        start_time.append(start)
+    return np.array(start_time, dtype=float)
 
 
 # pylint: disable=too-many-instance-attributes
@@ -35,30 +101,28 @@ class Model:
     nurse : MonitoredResource
         Subclass of SimPy resource representing nurses (whilst monitoring
         the resource during the simulation run).
-    patients : list
-        List containing the generated patient objects.
+    n_patients : int
+        Number of patients who have arrived so far.
+    first_patient : int
+        Index of the first patient to arrive after the warm-up period.
     nurse_time_used : float
-        Total time the nurse resources have been used in minutes.
-    nurse_time_used_correction : float
-        Correction for nurse time used with a warm-up period. Without
-        correction, it will be underestimated, as patients who start their
-        time with the nurse during the warm-up period and finish it during
-        the data collection period will not be included in the recorded
-        time.
+        Total time the nurse resources have been used during the data
+        collection period in minutes.
     nurse_consult_count : int
-        Count of patients seen by nurse, using to calculate running mean
-        wait time.
+        Count of patients seen by nurse during the simulation.
     running_mean_nurse_wait : float
-        Running mean wait time for nurse during simulation in minutes,
-        calculated using Welford's Running Average.
-    audit_list : list
-        List to store metrics recorded at regular intervals.
-    results_list : list
-        List of dictionaries with the results for each patient (as defined
-        by their patient object attributes).
-    patient_inter_arrival_dist : Exponential
+        Mean wait time for nurse of all patients seen during the simulation
+        in minutes.
+    audit_results : dict
+        Dictionary of arrays with the metrics recorded at regular intervals
+        during the data collection period.
+    results : dict
+        Dictionary of arrays with the results for each patient who arrived
+        after the warm-up period (patient_id, arrival_time, q_time_nurse and
+        time_with_nurse).
+    patient_inter_arrival_dist : BufferedExponential
         Distribution for sampling patient inter-arrival times.
-    nurse_consult_time_dist : Exponential
+    nurse_consult_time_dist : BufferedExponential
         Distribution for sampling nurse consultation times.
 
     Notes
@@ -90,207 +154,204 @@ class Model:
             self.env, capacity=self.param.number_of_nurses
         )
 
-        # Initialise attributes to store results
-        self.patients = []
+        # Initialise attributes to store results. Patient results are stored
+        # in one array per attribute, indexed by order of arrival - these are
+        # allocated in run(), once we know how many patients to expect.
+        self.n_patients = 0
+        self.first_patient = 0
+        self._arrival_time = np.empty(0)
+        self._start_time = np.empty(0)
+        self._time_with_nurse = np.empty(0)
         self.nurse_time_used = 0
-        self.nurse_time_used_correction = 0
         self.nurse_consult_count = 0
         self.running_mean_nurse_wait = 0
-        self.audit_list = []
-        self.results_list = []
+        self.audit_results = {}
+        self.results = {}
 
         # Generate seeds based on run_number as entropy (the "starter" seed)
         # The seeds produced will create independent streams
         ss = np.random.SeedSequence(entropy=self.run_number)
         seeds = ss.spawn(2)
 
-        # Initialise distributions using those seeds
-        self.patient_inter_arrival_dist = Exponential(
-            mean=self.param.patient_inter, random_seed=seeds[0])
-        self.nurse_consult_time_dist = Exponential(
-            mean=self.param.mean_n_consult_time, random_seed=seeds[1])
+        # Initialise distributions using those seeds. Each is sampled about
+        # once per patient, so they draw their samples in chunks of the
+        # expected number of patients in the run.
+        chunk = self._expected_patients()
+        self.patient_inter_arrival_dist = BufferedExponential(
+            mean=self.param.patient_inter, random_seed=seeds[0], chunk=chunk)
+        self.nurse_consult_time_dist = BufferedExponential(
+            mean=self.param.mean_n_consult_time, random_seed=seeds[1],
+            chunk=chunk)
 
         # Log model initialisation
-        self.param.logger.log(sim_time=self.env.now, msg="Initialise model:\n")
-        self.param.logger.log(vars(self))
-        self.param.logger.log(sim_time=self.env.now, msg="Parameters:\n ")
-        self.param.logger.log(vars(self.param))
+        if self.param.logger.enabled:
+            self.param.logger.log(sim_time=self.env.now,
+                                  msg="Initialise model:\n")
+            self.param.logger.log(vars(self))
+            self.param.logger.log(sim_time=self.env.now, msg="Parameters:\n ")
+            self.param.logger.log({name: getattr(self.param, name)
+                                   for name in self.param.__slots__})
 
     def valid_inputs(self):
         """
         Checks validity of provided parameters.
         """
-        # Define validation rules for attributes
-        # Doesn't include number_of_nurses as this is tested by simpy.Resource
-        validation_rules = {
-            "positive": [
-                "patient_inter", "mean_n_consult_time", "number_of_runs",
-                "audit_interval", "number_of_nurses"
-            ],
-            "non_negative": ["warm_up_period", "data_collection_period"]
-        }
-        # Iterate over the validation rules
-        for rule, param_names in validation_rules.items():
-            for param_name in param_names:
-                # Get the value of the parameter by its name
-                param_value = getattr(self.param, param_name)
-                # Check if it meets the rules for that parameter
-                if rule == "positive" and param_value <= 0:
-                    raise ValueError(
-                        f"Parameter '{param_name}' must be greater than 0.")
-                if rule == "non_negative" and param_value < 0:
-                    raise ValueError(
-                        f"Parameter '{param_name}' must be greater than or " +
-                        "equal to 0."
-                    )
+        for param_name in _POSITIVE_PARAMS:
+            if getattr(self.param, param_name) <= 0:
+                raise ValueError(
+                    f"Parameter '{param_name}' must be greater than 0.")
+        for param_name in _NON_NEGATIVE_PARAMS:
+            if getattr(self.param, param_name) < 0:
+                raise ValueError(
+                    f"Parameter '{param_name}' must be greater than or " +
+                    "equal to 0."
+                )
 
     def generate_patient_arrivals(self):
         """
         Generate patient arrivals.
         """
+        # Look up attributes used for every patient once, as local variables
+        # are quicker to access. Log messages are only composed if logging is
+        # enabled, as formatting them is costly.
+        env = self.env
+        timeout = env.timeout
+        process = env.process
+        attend_clinic = self.attend_clinic
+        sample_inter = self.patient_inter_arrival_dist.sample_one
+        warm_up = self.param.warm_up_period
+        log = self.param.logger.log
+        log_enabled = self.param.logger.enabled
+
         while True:
             # Sample and pass time to arrival
-            sampled_inter = self.patient_inter_arrival_dist.sample()
-            yield self.env.timeout(sampled_inter)
-
-            # Create new patient, with ID based on length of patient list + 1
-            p = Patient(len(self.patients) + 1)
-            p.arrival_time = self.env.now
-
-            # Add the patient to the list.
-            # The list stores a reference to the patient object, so any updates
-            # to the patient attributes will be reflected in the list as well
-            self.patients.append(p)
+            yield timeout(sample_inter())
+            now = env.now
+
+            # Record the new patient's arrival time, enlarging the arrays if
+            # they are full. The patient ID counts from the first patient
+            # after the warm-up period (i.e. restarts from 1 after warm-up).
+            index = self.n_patients
+            if index == len(self._arrival_time):
+                self._grow_patient_arrays()
+            self._arrival_time[index] = now
+            self.n_patients += 1
+            patient_id = index - self.first_patient + 1
 
             # Log arrival time
-            if p.arrival_time < self.param.warm_up_period:
-                arrive_pre = "\U0001F538 WU"
-            else:
-                arrive_pre = "\U0001F539 DC"
-            self.param.logger.log(
-                sim_time=self.env.now,
-                msg=(f"{arrive_pre} Patient {p.patient_id} arrives at: " +
-                     f"{p.arrival_time:.3f}.")
-            )
+            if log_enabled:
+                if now < warm_up:
+                    arrive_pre = "\U0001F538 WU"
+                else:
+                    arrive_pre = "\U0001F539 DC"
+                log(sim_time=now,
+                    msg=(f"{arrive_pre} Patient {patient_id} arrives at: " +
+                         f"{now:.3f}."))
 
             # Start process of attending clinic
-            self.env.process(self.attend_clinic(p))
+            process(attend_clinic(index, patient_id))
 
-    def attend_clinic(self, patient):
+    def _expected_patients(self):
+        """
+        Estimate the number of patients who will arrive during a run, with a
+        margin so that the estimate is rarely exceeded.
+
+        Returns
+        -------
+        int
+            Mean number of arrivals over the run length, plus 20% and 100
+            (so it is at least 100 for short runs).
+        """
+        run_length = (self.param.warm_up_period +
+                      self.param.data_collection_period)
+        return int(1.2 * run_length / self.param.patient_inter) + 100
+
+    def _grow_patient_arrays(self, size=None):
+        """
+        Enlarge the patient results arrays, filling the new space with NaN.
+
+        Parameters
+        ----------
+        size : int, optional
+            New length of the arrays. If not provided, their length is doubled.
+        """
+        if size is None:
+            size = max(2 * len(self._arrival_time), 1)
+        for name in ["_arrival_time", "_start_time", "_time_with_nurse"]:
+            old = getattr(self, name)
+            new = np.full(size, np.nan)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def attend_clinic(self, index, patient_id):
         """
         Simulates the patient's journey through the clinic.
 
         Parameters
         ----------
-        patient : Patient
-            Instance of the Patient() class representing a single patient.
+        index : int
+            Position of the patient in the patient results arrays.
+        patient_id : int
+            Patient's unique identifier.
         """
+        # Look up attributes used below once, as local variables are quicker
+        # to access
+        env = self.env
+        sample_consult = self.nurse_consult_time_dist.sample_one
+        warm_up = self.param.warm_up_period
+        log = self.param.logger.log
+        log_enabled = self.param.logger.enabled
+
         # Start queueing and request nurse resource
-        start_q_nurse = self.env.now
+        start_q_nurse = env.now
         with self.nurse.request() as req:
             yield req
 
-            # Record time spent waiting
-            patient.q_time_nurse = self.env.now - start_q_nurse
-
-            # Update running mean of wait time for the nurse
-            self.nurse_consult_count += 1
-            self.running_mean_nurse_wait += (
-                (patient.q_time_nurse - self.running_mean_nurse_wait) /
-                self.nurse_consult_count
-            )
+            # Record start time
+            now = env.now
+            self._start_time[index] = now
 
             # Sample time spent with nurse
-            patient.time_with_nurse = self.nurse_consult_time_dist.sample()
-
-            # Log wait time and time spent with nurse
-            if patient.arrival_time < self.param.warm_up_period:
-                nurse_pre = "\U0001F536 WU"
-            else:
-                nurse_pre = "\U0001F537 DC"
-            self.param.logger.log(
-                sim_time=self.env.now,
-                msg=(f"{nurse_pre} Patient {patient.patient_id} is seen by " +
-                     f"nurse after {patient.q_time_nurse:.3f}. Consultation " +
-                     f"length: {patient.time_with_nurse:.3f}.")
-            )
-
-            # Update the total nurse time used.
-            # This is used to calculate utilisation. To avoid overestimation,
-            # if the consultation would overrun the simulation, just record
-            # time to end of the simulation.
-            remaining_time = (
-                self.param.warm_up_period +
-                self.param.data_collection_period) - self.env.now
-            self.nurse_time_used += min(
-                patient.time_with_nurse, remaining_time)
-
-            # If still in the warm-up period, find if the patient time with
-            # nurse will go beyond end (if time_exceeding_warmup is positive) -
-            # and, in which case, save that to nurse_time_used_correction
-            # (ensuring to correct it if would exceed end of simulation).
-            remaining_warmup = self.param.warm_up_period - self.env.now
-            if remaining_warmup > 0:
-                time_exceeding_warmup = (patient.time_with_nurse -
-                                         remaining_warmup)
-                if time_exceeding_warmup > 0:
-                    self.nurse_time_used_correction += min(
-                        time_exceeding_warmup,
-                        self.param.data_collection_period)
-                    # Logging message
-                    self.param.logger.log(
-                        sim_time=self.env.now,
-                        msg=(f"\U0001F6E0 Patient {patient.patient_id} " +
+            time_with_nurse = sample_consult()
+            self._time_with_nurse[index] = time_with_nurse
+
+            if log_enabled:
+                # Log wait time and time spent with nurse
+                if start_q_nurse < warm_up:
+                    nurse_pre = "\U0001F536 WU"
+                else:
+                    nurse_pre = "\U0001F537 DC"
+                log(sim_time=now,
+                    msg=(f"{nurse_pre} Patient {patient_id} is seen by " +
+                         f"nurse after {now - start_q_nurse:.3f}. " +
+                         f"Consultation length: {time_with_nurse:.3f}."))
+
+                # Log if the consultation starts during the warm-up period but
+                # will continue into the data collection period. The time
+                # after warm-up is included in nurse_time_used by
+                # record_results().
+                remaining_warmup = warm_up - now
+                if 0 < remaining_warmup < time_with_nurse:
+                    time_exceeding_warmup = time_with_nurse - remaining_warmup
+                    log(sim_time=now,
+                        msg=(f"\U0001F6E0 Patient {patient_id} " +
                              "starts consultation with " +
-                             f"{remaining_warmup:.3f} left of warm-up (which" +
-                             f" is {self.param.warm_up_period:.3f}). " +
+                             f"{remaining_warmup:.3f} left of warm-up " +
+                             f"(which is {warm_up:.3f}). " +
                              "As their consultation is for " +
-                             f"{patient.time_with_nurse:.3f}, they will " +
-                             f"exceed warmup by {time_exceeding_warmup:.3f}," +
-                             "so we correct for this.")
-                    )
+                             f"{time_with_nurse:.3f}, they will " +
+                             "exceed warmup by " +
+                             f"{time_exceeding_warmup:.3f}," +
+                             "so we correct for this."))
 
             # Pass time spent with nurse
-            yield self.env.timeout(patient.time_with_nurse)
-
-    def interval_audit(self, interval):
-        """
-        Audit waiting times and resource utilisation at regular intervals.
-        This is set-up to start when the warm-up period has ended.
-
-        The running mean wait time is calculated using Welford's Running
-        Average, which is a method that avoids the need to store previous wait
-        times to compute the average. The running mean reflects the main wait
-        time for all patients seen by nurse up to that point in the simulation.
-
-        Parameters
-        ----------
-        interval : int
-            Time between audits in minutes.
-        """
-        # Wait until warm-up period has passed
-        yield self.env.timeout(self.param.warm_up_period)
-
-        # Begin interval auditor
-        while True:
-            self.audit_list.append({
-                "resource_name": "nurse",
-                "simulation_time": self.env.now,
-                "utilisation": self.nurse.count / self.nurse.capacity,
-                "queue_length": len(self.nurse.queue),
-                "running_mean_wait_time": self.running_mean_nurse_wait
-            })
-
-            # Trigger next audit after desired interval has passed
-            yield self.env.timeout(interval)
+            yield env.timeout(time_with_nurse)
 
     def init_results_variables(self):
         """
         Resets all results collection variables to their initial values.
         """
-        self.patients = []
-        self.nurse_time_used = 0
-        self.audit_list = []
+        self.first_patient = self.n_patients
         self.nurse.init_results()
 
     def warm_up_complete(self):
@@ -305,12 +366,6 @@ class Model:
             # Reset results collection variables
             self.init_results_variables()
 
-            # Correct nurse_time_used, adding the remaining time of patients
-            # who were partway through their consultation during the warm-up
-            # period (i.e. patients still in consultation as enter the
-            # data collection period).
-            self.nurse_time_used += self.nurse_time_used_correction
-
             # If there was a warm-up period, log that this time has passed so
             # can distinguish between patients before and after warm-up in logs
             self.param.logger.log(sim_time=self.env.now, msg="──────────")
@@ -327,6 +382,10 @@ class Model:
         run_length = (self.param.warm_up_period +
                       self.param.data_collection_period)
 
+        # Allocate arrays to store patient results, with space for more than
+        # the expected number of arrivals (they are enlarged if needed)
+        self._grow_patient_arrays(size=self._expected_patients())
+
         # Schedule process which will reset results when warm-up period ends
         # (or does nothing if there is no warm-up)
         self.env.process(self.warm_up_complete())
@@ -334,10 +393,6 @@ class Model:
         # Schedule patient generator to run during simulation
         self.env.process(self.generate_patient_arrivals())
 
-        # Schedule interval auditor to run during simulation
-        self.env.process(
-            self.interval_audit(interval=self.param.audit_interval))
-
         # Run the simulation
         self.env.run(until=run_length)
 
@@ -353,6 +408,148 @@ class Model:
         if self.param.data_collection_period == 0:
             self.init_results_variables()
 
-        # Convert list of patient objects into a list that just contains the
-        # attributes of each of those patients as dictionaries
-        self.results_list = [x.__dict__ for x in self.patients]
+        # Record results and interval audit from the times for every patient
+        self.record_results(
+            arrival_time=self._arrival_time[:self.n_patients],
+            start_time=self._start_time[:self.n_patients],
+            time_with_nurse=self._time_with_nurse[:self.n_patients])
+
+    def record_results(self, arrival_time, start_time, time_with_nurse):
+        """
+        Record the patient results, nurse time used and interval audit, given
+        the times for every patient in the simulation (including those in the
+        warm-up).
+
+        Parameters
+        ----------
+        arrival_time : np.ndarray
+            Arrival time of each patient, in order of arrival.
+        start_time : np.ndarray
+            Time each patient started their consultation (NaN if unseen).
+        time_with_nurse : np.ndarray
+            Consultation length for each patient (NaN if unseen).
+        """
+        warm_up = self.param.warm_up_period
+        run_length = warm_up + self.param.data_collection_period
+
+        # Nurse time used during the data collection period (i.e. the overlap
+        # between each consultation and the data collection period). This
+        # includes the time after warm-up for consultations that started
+        # during the warm-up, and excludes any time beyond the end of the run.
+        seen = ~np.isnan(start_time)
+        self.nurse_time_used = float(np.clip(
+            np.minimum(start_time[seen] + time_with_nurse[seen], run_length) -
+            np.maximum(start_time[seen], warm_up), 0, None).sum())
+
+        # Store results for patients who arrived after the warm-up period,
+        # with IDs starting from 1
+        recorded = arrival_time >= warm_up
+        self.results = {
+            "patient_id": np.arange(1, recorded.sum() + 1),
+            "arrival_time": arrival_time[recorded],
+            "q_time_nurse": start_time[recorded] - arrival_time[recorded],
+            "time_with_nurse": time_with_nurse[recorded]
+        }
+
+        # Interval audit, taken at regular intervals from the end of the
+        # warm-up period. The utilisation and queue length at each audit are
+        # found from the number of patients who have arrived, started and
+        # finished their consultation by that time.
+        audit_times = []
+        audit_time = warm_up
+        while audit_time < run_length:
+            audit_times.append(audit_time)
+            audit_time += self.param.audit_interval
+        audit_times = np.array(audit_times)
+        n_arrived = np.searchsorted(arrival_time, audit_times, side="right")
+        n_started = np.searchsorted(start_time, audit_times, side="right")
+        n_finished = np.searchsorted(
+            np.sort(start_time[seen] + time_with_nurse[seen]), audit_times,
+            side="right")
+        # The running mean wait time is the mean wait of all patients seen by
+        # the time of each audit (including those seen in the warm-up), with
+        # 0 for audits before anyone has been seen
+        q_time_seen = start_time[seen] - arrival_time[seen]
+        self.nurse_consult_count = len(q_time_seen)
+        running_mean_wait = np.concatenate((
+            [0], np.cumsum(q_time_seen) /
+            np.arange(1, self.nurse_consult_count + 1)))
+        self.running_mean_nurse_wait = running_mean_wait[-1]
+        self.audit_results = {
+            "resource_name": ["nurse"] * len(audit_times),
+            "simulation_time": audit_times,
+            "utilisation": (
+                (n_started - n_finished) / self.param.number_of_nurses),
+            "queue_length": n_arrived - n_started,
+            "running_mean_wait_time": running_mean_wait[n_started]
+        }
+
+    # pylint: disable=too-many-locals
+    def run_fast(self):
+        """
+        Runs the simulation without the SimPy event loop.
+
+        Patients are seen in the order they arrive (first come, first served),
+        so the time each patient starts their consultation can be found
+        directly from the arrival and consultation times, by keeping track of
+        when each nurse will next be free (the Lindley recursion). This
+        produces the same results as run(), but is much faster as it avoids
+        creating a SimPy process and resource request for every patient.
+
+        Note: the simulation is not stepped through event-by-event, so the
+        patient-level events are not logged in this mode.
+        """
+        # Calculate the total run length
+        warm_up = self.param.warm_up_period
+        run_length = warm_up + self.param.data_collection_period
+        capacity = self.param.number_of_nurses
+
+        # Sample inter-arrival times in chunks until the end of the run is
+        # passed, then keep arrivals that occur before the end. The arrival
+        # times are accumulated from the previous chunk end in the same order
+        # as SimPy would, so they are identical to those from run().
+        chunk = max(int(run_length / self.param.patient_inter), 1)
+        chunks = [np.empty(0)]
+        last_arrival = 0
+        while last_arrival < run_length:
+            arrivals = np.cumsum(np.concatenate(
+                ([last_arrival],
+                 self.patient_inter_arrival_dist.sample(size=chunk))))[1:]
+            chunks.append(arrivals)
+            last_arrival = arrivals[-1]
+        arrival_time = np.concatenate(chunks)
+        arrival_time = arrival_time[arrival_time < run_length]
+        n_patients = len(arrival_time)
+
+        # Sample consultation times (patients are seen in arrival order, so
+        # the i-th consultation sampled in run() belongs to the i-th patient)
+        time_with_nurse = self.nurse_consult_time_dist.sample(size=n_patients)
+
+        # Find the start of each consultation
+        start_time = _simulate_core(arrival_time, time_with_nurse, capacity)
+
+        # Patients who are not seen before the end of the simulation have no
+        # wait time or consultation time recorded
+        seen = start_time < run_length
+        time_with_nurse = np.where(seen, time_with_nurse, np.nan)
+
+        # Record patient results, nurse time used and interval audit
+        self.n_patients = n_patients
+        self.first_patient = int((arrival_time < warm_up).sum())
+        self.record_results(
+            arrival_time=arrival_time,
+            start_time=np.where(seen, start_time, np.nan),
+            time_with_nurse=time_with_nurse)
+
+        # Time-weighted statistics for the nurse resource, as would be
+        # recorded by MonitoredResource during the data collection period
+        queue_time = np.clip(
+            np.minimum(start_time, run_length) -
+            np.maximum(arrival_time, warm_up), 0, None)
+        self.nurse.time_last_event = run_length
+        self.nurse.area_resource_busy = self.nurse_time_used
+        self.nurse.area_n_in_queue = float(queue_time.sum())
+
+        # Advance the SimPy clock to the end of the run, so env.now matches
+        # run() when used to calculate the wait time of unseen patients
+        self.env.run(until=run_length)
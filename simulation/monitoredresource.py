@@ -22,13 +22,13 @@ class MonitoredResource(Resource):
 
     Attributes
     ----------
-    time_last_event : list
+    time_last_event : float
         Time of last resource request or release.
-    area_n_in_queue : list
+    area_n_in_queue : float
         Time that patients have spent queueing for the resource
         (i.e. sum of the times each patient spent waiting). Used to
         calculate the average queue length.
-    area_resource_busy : list
+    area_resource_busy : float
         Time that resources have been in use during the simulation
         (i.e. sum of the times each individual resource was busy). Used
         to calculated utilisation.
@@ -59,9 +59,9 @@ class MonitoredResource(Resource):
         """
         Resets monitoring attributes to initial values.
         """
-        self.time_last_event = [self._env.now]
-        self.area_n_in_queue = [0.0]
-        self.area_resource_busy = [0.0]
+        self.time_last_event = self._env.now
+        self.area_n_in_queue = 0.0
+        self.area_resource_busy = 0.0
 
     def request(self, *args, **kwargs):
         """
@@ -116,7 +116,7 @@ class MonitoredResource(Resource):
         - Total queue time (number of requests in queue * time)
         - Total resource use (number of resources in use * time)
 
-        These are summed to return the totals from across the whole simulation.
+        These are added to running totals from across the whole simulation.
 
         Notes
         -----
@@ -125,16 +125,20 @@ class MonitoredResource(Resource):
           long certain events or states (such as resource use or queue length)
           persist over time.
         """
-        # Calculate time since last event
-        time_since_last_event = self._env.now - self.time_last_event[-1]
+        # Calculate time since last event. If no time has passed (e.g. a
+        # release and request at the same time), there is nothing to add.
+        now = self._env.now
+        time_since_last_event = now - self.time_last_event
+        if time_since_last_event == 0:
+            return
 
-        # Add record of current time
-        self.time_last_event.append(self._env.now)
+        # Record current time
+        self.time_last_event = now
 
         # Add "area under curve" of people in queue
         # len(self.queue) is the number of requests queued
-        self.area_n_in_queue.append(len(self.queue) * time_since_last_event)
+        self.area_n_in_queue += len(self.queue) * time_since_last_event
 
         # Add "area under curve" of resources in use
         # self.count is the number of resources in use
-        self.area_resource_busy.append(self.count * time_since_last_event)
+        self.area_resource_busy += self.count * time_since_last_event
@@ -8,10 +8,39 @@ support the simulation process in python
 (https://github.com/TomMonks/sim-tools) (MIT Licence).
 """
 
+from functools import lru_cache
+import math
+
 import numpy as np
-from scipy.stats import t
+from scipy.special import stdtrit  # pylint: disable=no-name-in-module
+
+
+@lru_cache(maxsize=256)
+def _t_value(alpha, dof):
+    """
+    Find the critical value of the t-distribution for a two-sided confidence
+    interval.
+
+    This is cached, as the confidence interval is recalculated after every
+    replication, with the same alpha and a small number of distinct degrees
+    of freedom.
 
+    Parameters
+    ----------
+    alpha : float
+        Significance level for confidence interval calculations.
+    dof : int
+        Degrees of freedom.
+
+    Returns
+    -------
+    float
+        Critical value (NaN if dof is less than 1).
+    """
+    return float(stdtrit(dof, 1 - (alpha / 2)))
 
+
+# pylint: disable=too-many-instance-attributes
 class OnlineStatistics:
     """
     Computes running sample mean and variance (using Welford's algorithm),
@@ -35,11 +64,17 @@ class OnlineStatistics:
         Significance level for confidence interval calculations.
     observer : list
         Object to notify on updates.
+    _cache : dict
+        Statistics calculated from the current data (see _statistics()).
+    _cache_key : tuple
+        Number of data points and alpha when _cache was calculated.
 
     Notes
     -----
     Class adapted from Monks 2021.
     """
+    __slots__ = ("n", "x_i", "mean", "_sq", "alpha", "observer", "_cache",
+                 "_cache_key")
 
     def __init__(self, data=None, alpha=0.05, observer=None):
         """
@@ -60,12 +95,13 @@ class OnlineStatistics:
         self._sq = None
         self.alpha = alpha
         self.observer = observer
+        self._cache = None
+        self._cache_key = None
 
-        # If an array of initial values are supplied, then run update()
+        # If an array of initial values are supplied, then run update_batch()
         if data is not None:
             if isinstance(data, np.ndarray):
-                for x in data:
-                    self.update(x)
+                self.update_batch(data)
             # Raise an error if in different format - else will invisibly
             # proceed and won't notice it hasn't done this
             else:
@@ -98,6 +134,45 @@ class OnlineStatistics:
         if self.observer is not None:
             self.observer.update(self)
 
+    def update_batch(self, data):
+        """
+        Update the mean and variance with an array of new data points at once.
+
+        The mean and sum of squared differences of the new data are computed
+        with NumPy, then combined with the running statistics using the
+        parallel form of Welford's algorithm (Chan, Golub and LeVeque 1979).
+        If there is an observer, the data points are instead added one at a
+        time with update(), so the observer is notified of each one (e.g. so
+        ReplicationTabulizer records a row for every replication).
+
+        Parameters
+        ----------
+        data : np.ndarray
+            New data points.
+        """
+        if self.observer is not None:
+            for x in data:
+                self.update(x)
+            return
+
+        data = np.asarray(data, dtype=float)
+        if data.size == 0:
+            return
+        batch_n = data.size
+        batch_mean = float(data.mean())
+        batch_sq = float(((data - batch_mean) ** 2).sum())
+
+        if self.n == 0:
+            self.mean = batch_mean
+            self._sq = batch_sq
+        else:
+            total_n = self.n + batch_n
+            delta = batch_mean - self.mean
+            self.mean += delta * batch_n / total_n
+            self._sq += batch_sq + delta ** 2 * self.n * batch_n / total_n
+        self.n += batch_n
+        self.x_i = data[-1]
+
     @property
     def variance(self):
         """
@@ -114,84 +189,139 @@ class OnlineStatistics:
     @property
     def std(self):
         """
-        Computes and returns the standard deviation, or NaN if not enough data.
+        Returns the standard deviation, or NaN if not enough data.
 
         Returns
         -------
         float
             Standard deviation.
         """
-        if self.n > 2:
-            return np.sqrt(self.variance)
-        return np.nan
+        return self._statistics()["std"]
 
     @property
     def std_error(self):
         """
-        Computes and returns the standard error of the mean.
+        Returns the standard error of the mean, or NaN if not enough data.
 
         Returns
         -------
         float
             Standard error.
         """
-        return self.std / np.sqrt(self.n)
+        return self._statistics()["std_error"]
 
     @property
     def half_width(self):
         """
-        Computes and returns the half-width of the confidence interval.
+        Returns the half-width of the confidence interval, or NaN if not
+        enough data.
 
         Returns
         -------
         float
             Confidence interval half-width.
         """
-        dof = self.n - 1
-        t_value = t.ppf(1 - (self.alpha / 2), dof)
-        return t_value * self.std_error
+        return self._statistics()["half_width"]
 
     @property
     def lci(self):
         """
-        Computes and returns the lower confidence interval bound, or NaN if
-        not enough data.
+        Returns the lower confidence interval bound, or NaN if not enough
+        data.
 
         Returns
         -------
         float
             Lower confidence interval bound.
         """
-        if self.n > 2:
-            return self.mean - self.half_width
-        return np.nan
+        return self._statistics()["lci"]
 
     @property
     def uci(self):
         """
-        Computes and returns the upper confidence interval bound, or NaN if
-        not enough data.
+        Returns the upper confidence interval bound, or NaN if not enough
+        data.
 
         Returns
         -------
         float
             Upper confidence interval bound.
         """
-        if self.n > 2:
-            return self.mean + self.half_width
-        return np.nan
+        return self._statistics()["uci"]
 
     @property
     def deviation(self):
         """
-        Computes and returns the precision of the confidence interval
-        expressed as the percentage deviation of the half width from the mean.
+        Returns the precision of the confidence interval expressed as the
+        percentage deviation of the half width from the mean, or NaN if not
+        enough data.
 
         Returns
         -------
         float
             Relative deviation of the confidence interval half width.
         """
-        if self.n > 2:
-            return self.half_width / self.mean
-        return np.nan
+        return self._statistics()["deviation"]
+
+    def summary(self):
+        """
+        Returns all of the statistics at once.
+
+        Returns
+        -------
+        dict
+            Dictionary with the mean, variance, std, std_error, half_width,
+            lci, uci and deviation. All but the mean and variance are NaN if
+            there are two or fewer data points.
+        """
+        return dict(self._statistics())
+
+    def _statistics(self):
+        """
+        Computes all of the statistics together, caching them until the next
+        update (or change to alpha).
+
+        The standard deviation and confidence interval half-width are used
+        by several statistics, so they are calculated once here, rather than
+        each time a property is accessed. ReplicationTabulizer and
+        ReplicationsAlgorithm both read the statistics after every update,
+        so this is the only calculation needed per replication.
+
+        Returns
+        -------
+        dict
+            Dictionary with the statistics (should not be modified).
+        """
+        key = (self.n, self.alpha)
+        if self._cache_key == key:
+            return self._cache
+
+        if self.n <= 2:
+            self._cache = {
+                "mean": self.mean,
+                "variance": (self._sq / (self.n - 1) if self.n == 2
+                             else np.nan),
+                "std": np.nan,
+                "std_error": np.nan,
+                "half_width": np.nan,
+                "lci": np.nan,
+                "uci": np.nan,
+                "deviation": np.nan
+            }
+        else:
+            variance = self._sq / (self.n - 1)
+            std = math.sqrt(variance)
+            std_error = std / math.sqrt(self.n)
+            half_width = _t_value(self.alpha, self.n - 1) * std_error
+            self._cache = {
+                "mean": self.mean,
+                "variance": variance,
+                "std": std,
+                "std_error": std_error,
+                "half_width": half_width,
+                "lci": self.mean - half_width,
+                "uci": self.mean + half_width,
+                "deviation": half_width / self.mean
+            }
+        self._cache_key = key
+        return self._cache
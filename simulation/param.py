@@ -4,6 +4,10 @@ Param.
 
 from .simlogger import SimLogger
 
+# Logger used when none is provided (with logging disabled), shared by all
+# instances of Param
+_DEFAULT_LOGGER = SimLogger(log_to_console=False, log_to_file=False)
+
 
 # pylint: disable=too-many-instance-attributes,too-few-public-methods
 
@@ -11,10 +15,13 @@ class Param:
     """
     Default parameters for simulation.
 
+    The attributes are declared in `__slots__`, so existing attributes can be
+    modified but new attributes cannot be created (raising an AttributeError).
+    This avoids mistakes where it looks like a parameter has been changed,
+    but the wrong attribute name was used.
+
     Attributes
     ----------
-    _initialising : bool
-        Whether the object is currently initialising.
     patient_inter : float
         Mean inter-arrival time between patients in minutes.
     mean_n_consult_time : float
@@ -36,7 +43,16 @@ class Param:
         available cores, set to -1. For sequential execution, set to 1.
     logger : logging.Logger
         The logging instance used for logging messages.
+    fast_mode : bool
+        Whether to run the model using Model.run_fast() (which avoids the
+        SimPy event loop) rather than Model.run().
     """
+    __slots__ = (
+        "patient_inter", "mean_n_consult_time", "number_of_nurses",
+        "warm_up_period", "data_collection_period", "number_of_runs",
+        "audit_interval", "scenario_name", "cores", "logger", "fast_mode"
+    )
+
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
@@ -49,7 +65,8 @@ class Param:
         audit_interval=120,  # Every 2 hours
         scenario_name=0,
         cores=-1,
-        logger=SimLogger(log_to_console=False, log_to_file=False)
+        logger=None,
+        fast_mode=False
     ):
         """
         Initialise instance of parameters class.
@@ -75,10 +92,15 @@ class Param:
         cores : int, optional
             Number of CPU cores to use for parallel execution.
         logger : logging.Logger, optional
-            The logging instance used for logging messages.
+            The logging instance used for logging messages. If not provided,
+            uses a shared SimLogger with logging disabled.
+        fast_mode : bool, optional
+            Whether to run the model using Model.run_fast() rather than
+            Model.run(). Results are the same, but patient-level events are
+            not logged. Replications are always run sequentially in fast
+            mode, as each takes so little time that starting parallel worker
+            processes would cost more than it saves.
         """
-        # Disable restriction on attribute modification during initialisation
-        object.__setattr__(self, "_initialising", True)
         self.patient_inter = patient_inter
         self.mean_n_consult_time = mean_n_consult_time
         self.number_of_nurses = number_of_nurses
@@ -88,38 +110,5 @@ class Param:
         self.audit_interval = audit_interval
         self.scenario_name = scenario_name
         self.cores = cores
-        self.logger = logger
-
-        # Re-enable attribute checks after initialisation
-        object.__setattr__(self, "_initialising", False)
-
-    def __setattr__(self, name, value):
-        """
-        Prevent addition of new attributes.
-
-        Parameters
-        ----------
-        name : str
-            The name of the attribute to set.
-        value : Any
-            The value to assign to the attribute.
-
-        Raises
-        ------
-        AttributeError
-            If `name` is not an existing attribute and an attempt is made
-            to add it to the instance.
-        """
-        # Skip the check if the object is still initialising
-        # pylint: disable=maybe-no-member
-        if hasattr(self, "_initialising") and self._initialising:
-            super().__setattr__(name, value)
-        else:
-            # Check if attribute of that name is already present
-            if name in self.__dict__:
-                super().__setattr__(name, value)
-            else:
-                raise AttributeError(
-                    f"Cannot add new attribute '{name}' - only possible to "
-                    f"modify existing attributes: {self.__dict__.keys()}"
-                )
+        self.logger = _DEFAULT_LOGGER if logger is None else logger
+        self.fast_mode = fast_mode
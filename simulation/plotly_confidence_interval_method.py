@@ -8,6 +8,7 @@ support the simulation process in python
 (https://github.com/TomMonks/sim-tools) (MIT Licence).
 """
 
+import numpy as np
 import plotly.graph_objects as go
 
 
@@ -31,7 +32,10 @@ def plotly_confidence_interval_method(
     figsize : tuple, optional
         Plot dimensions in pixels (width, height).
     file_path : str, optional
-        Path and filename to save the plot to.
+        Path and filename to save the plot to. Files ending ".html" are
+        saved as interactive HTML (loading plotly.js from a CDN) and ".json"
+        as Plotly JSON, both of which are much quicker than rendering a
+        static image (e.g. ".png"), which requires Kaleido.
 
     Returns
     -------
@@ -44,29 +48,34 @@ def plotly_confidence_interval_method(
     """
     fig = go.Figure()
 
+    # Get each column used in the plot as an array
+    replications = conf_ints["replications"].to_numpy()
+    upper_ci = conf_ints["upper_ci"].to_numpy()
+    lower_ci = conf_ints["lower_ci"].to_numpy()
+    cumulative_mean = conf_ints["cumulative_mean"].to_numpy()
+
     # Calculate relative deviations
-    deviation_pct = (
-        (conf_ints["upper_ci"] - conf_ints["cumulative_mean"])
-        / conf_ints["cumulative_mean"]
-        * 100
-    ).round(2)
+    deviation_pct = np.round(
+        (upper_ci - cumulative_mean) / cumulative_mean * 100, 2)
 
     # Confidence interval as shaded region
     fig.add_trace(
         go.Scatter(
-            x=conf_ints["replications"],
-            y=conf_ints["upper_ci"],
+            x=replications,
+            y=upper_ci,
             mode="lines",
             line={"width": 0},
             showlegend=False,
             name="Upper CI",
-            text=[f"Deviation: {d}%" for d in deviation_pct]
+            # Deviation is formatted by Plotly when hovering
+            customdata=deviation_pct,
+            hovertemplate="%{y}<br>Deviation: %{customdata}%"
         )
     )
     fig.add_trace(
         go.Scatter(
-            x=conf_ints["replications"],
-            y=conf_ints["lower_ci"],
+            x=replications,
+            y=lower_ci,
             mode="lines",
             line={"width": 0},
             fill="tonexty",  # Fill to previous y trace
@@ -78,8 +87,8 @@ def plotly_confidence_interval_method(
     # Cumulative mean line with enhanced hover
     fig.add_trace(
         go.Scatter(
-            x=conf_ints["replications"],
-            y=conf_ints["cumulative_mean"],
+            x=replications,
+            y=cumulative_mean,
             line={"color": "blue", "width": 2},
             name="Cumulative Mean",
             hoverinfo="x+y+name"
@@ -109,5 +118,10 @@ def plotly_confidence_interval_method(
 
     # Save figure
     if file_path is not None:
-        fig.write_image(file_path)
+        if file_path.endswith(".html"):
+            fig.write_html(file_path, include_plotlyjs="cdn")
+        elif file_path.endswith(".json"):
+            fig.write_json(file_path)
+        else:
+            fig.write_image(file_path)
     return fig
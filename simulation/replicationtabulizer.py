@@ -63,12 +63,13 @@ class ReplicationTabulizer:
             measures like the mean, standard deviation and confidence
             intervals.
         """
+        summary = results.summary()
         self.x_i.append(results.x_i)
-        self.cumulative_mean.append(results.mean)
-        self.stdev.append(results.std)
-        self.lower.append(results.lci)
-        self.upper.append(results.uci)
-        self.dev.append(results.deviation)
+        self.cumulative_mean.append(summary["mean"])
+        self.stdev.append(summary["std"])
+        self.lower.append(summary["lci"])
+        self.upper.append(summary["uci"])
+        self.dev.append(summary["deviation"])
         self.n += 1
 
     def summary_table(self):
@@ -12,8 +12,130 @@ from joblib import Parallel, delayed, cpu_count
 import pandas as pd
 import numpy as np
 
+from ._utils import concat_columns
 from .model import Model
-from .summary_stats import summary_stats
+from .summary_stats import summary_stats_table
+
+
+def _mean(values):
+    """
+    Find the mean of an array, returning NaN (without a warning) if empty.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values to find the mean of.
+
+    Returns
+    -------
+    float
+        Mean of the values.
+    """
+    return values.mean() if len(values) > 0 else np.nan
+
+
+def _run_single(param, run):
+    """
+    Executes a single simulation run, returning the patient-level and
+    interval audit results as dictionaries of arrays (rather than
+    dataframes), so results from many runs can be joined cheaply.
+
+    This is a module-level function (rather than a method of Runner) so
+    that only the parameters and run number need to be sent to each
+    worker when running replications in parallel.
+
+    Parameters
+    ----------
+    param : Param
+        Simulation parameters.
+    run : int
+        The run number for the simulation.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the patient-level results, results from
+        each run, and interval audit results.
+    """
+    # Run model
+    model = Model(param=param, run_number=run)
+    if param.fast_mode:
+        model.run_fast()
+    else:
+        model.run()
+
+    # PATIENT RESULTS
+    # Add columns with the run, and with the wait time of patients who
+    # remained unseen at the end of the simulation
+    patient_results = dict(model.results)
+    arrivals = len(patient_results["patient_id"])
+    patient_results["run"] = np.full(arrivals, run)
+    unseen = np.isnan(patient_results["time_with_nurse"])
+    patient_results["q_time_unseen_nurse"] = np.where(
+        unseen, model.env.now - patient_results["arrival_time"], np.nan)
+
+    # RUN RESULTS
+    # The run, scenario and arrivals are handled the same regardless of
+    # whether there were any patients
+    run_results = {
+        "run_number": run,
+        "scenario": param.scenario_name,
+        "arrivals": arrivals
+    }
+    # If there was at least one patient...
+    if arrivals > 0:
+        # Create dictionary recording the run results
+        # Currently has two alternative methods of measuring utilisation
+        run_results = {
+            **run_results,
+            "mean_q_time_nurse": _mean(
+                patient_results["q_time_nurse"][~unseen]),
+            "mean_time_with_nurse": _mean(
+                patient_results["time_with_nurse"][~unseen]),
+            "mean_nurse_utilisation": (
+                model.nurse_time_used / (
+                    param.number_of_nurses *
+                    param.data_collection_period
+                )
+            ),
+            "mean_nurse_utilisation_tw": (
+                model.nurse.area_resource_busy / (
+                    param.number_of_nurses *
+                    param.data_collection_period
+                )
+            ),
+            "mean_nurse_q_length": (
+                model.nurse.area_n_in_queue /
+                param.data_collection_period
+            ),
+            "count_nurse_unseen": unseen.sum(),
+            "mean_q_time_nurse_unseen": _mean(
+                patient_results["q_time_unseen_nurse"][unseen])
+        }
+    else:
+        # Set results to NaN if no patients
+        run_results = {
+            **run_results,
+            "mean_q_time_nurse": np.nan,
+            "mean_time_with_nurse": np.nan,
+            "mean_nurse_utilisation": np.nan,
+            "mean_nurse_utilisation_tw": np.nan,
+            "mean_nurse_q_length": np.nan,
+            "count_nurse_unseen": np.nan,
+            "mean_q_time_nurse_unseen": np.nan
+        }
+
+    # INTERVAL AUDIT RESULTS
+    # Add column with run to the interval audit results
+    interval_audit = dict(model.audit_results)
+    interval_audit["run"] = np.full(
+        len(interval_audit["simulation_time"]), run)
+
+    return {
+        "patient": patient_results,
+        "run": run_results,
+        "interval_audit": interval_audit
+    }
 
 
 class Runner:
@@ -73,114 +195,41 @@ class Runner:
             A dictionary containing the patient-level results, results from
             each run, and interval audit results.
         """
-        # Run model
-        model = Model(param=self.param, run_number=run)
-        model.run()
-
-        # PATIENT RESULTS
-        # Convert patient-level results to a dataframe and add column with run
-        patient_results = pd.DataFrame(model.results_list)
-        patient_results["run"] = run
-        # If there was at least one patient...
-        if len(patient_results) > 0:
-            # Add a column with the wait time of patients who remained unseen
-            # at the end of the simulation
-            patient_results["q_time_unseen_nurse"] = np.where(
-                patient_results["time_with_nurse"].isna(),
-                model.env.now - patient_results["arrival_time"], np.nan
-            )
-        else:
-            # Set to NaN if no patients
-            patient_results["q_time_unseen_nurse"] = np.nan
-
-        # RUN RESULTS
-        # The run, scenario and arrivals are handled the same regardless of
-        # whether there were any patients
-        run_results = {
-            "run_number": run,
-            "scenario": self.param.scenario_name,
-            "arrivals": len(patient_results)
-        }
-        # If there was at least one patient...
-        if len(patient_results) > 0:
-            # Create dictionary recording the run results
-            # Currently has two alternative methods of measuring utilisation
-            run_results = {
-                **run_results,
-                "mean_q_time_nurse": patient_results["q_time_nurse"].mean(),
-                "mean_time_with_nurse": (
-                    patient_results["time_with_nurse"].mean()
-                ),
-                "mean_nurse_utilisation": (
-                    model.nurse_time_used / (
-                        self.param.number_of_nurses *
-                        self.param.data_collection_period
-                    )
-                ),
-                "mean_nurse_utilisation_tw": (
-                    sum(model.nurse.area_resource_busy) / (
-                        self.param.number_of_nurses *
-                        self.param.data_collection_period
-                    )
-                ),
-                "mean_nurse_q_length": (
-                    sum(model.nurse.area_n_in_queue) /
-                    self.param.data_collection_period
-                ),
-                "count_nurse_unseen": (
-                    patient_results["time_with_nurse"].isna().sum()
-                ),
-                "mean_q_time_nurse_unseen": (
-                    patient_results["q_time_unseen_nurse"].mean()
-                )
-            }
-        else:
-            # Set results to NaN if no patients
-            run_results = {
-                **run_results,
-                "mean_q_time_nurse": np.nan,
-                "mean_time_with_nurse": np.nan,
-                "mean_nurse_utilisation": np.nan,
-                "mean_nurse_utilisation_tw": np.nan,
-                "mean_nurse_q_length": np.nan,
-                "count_nurse_unseen": np.nan,
-                "mean_q_time_nurse_unseen": np.nan
-            }
-
-        # INTERVAL AUDIT RESULTS
-        # Convert interval audit results to a dataframe and add run column
-        interval_audit_df = pd.DataFrame(model.audit_list)
-        interval_audit_df["run"] = run
-
+        results = _run_single(self.param, run)
         return {
-            "patient": patient_results,
-            "run": run_results,
-            "interval_audit": interval_audit_df
+            "patient": pd.DataFrame(results["patient"]),
+            "run": results["run"],
+            "interval_audit": pd.DataFrame(results["interval_audit"])
         }
 
     def run_reps(self):
         """
         Execute a single model configuration for multiple runs/replications.
 
-        These can be run sequentially or in parallel.
+        These can be run sequentially or in parallel. In fast mode, they are
+        always run sequentially, as each replication is quick enough that the
+        overhead of starting worker processes and transferring results back
+        outweighs any gain from running them in parallel.
         """
+        # Check number of cores is valid - must be -1, or between 1 and
+        # total CPUs-1 (saving one for logic control). 1 is always valid, as
+        # the runs are then sequential. Checked before choosing how to run, so
+        # invalid values are caught in fast mode too.
+        # Done here rather than in model as this is called before model,
+        # and only relevant for Runner.
+        valid_cores = [-1] + list(range(1, max(cpu_count(), 2)))
+        if self.param.cores not in valid_cores:
+            raise ValueError(
+                f"Invalid cores: {self.param.cores}. Must be one of: " +
+                f"{valid_cores}."
+            )
+
         # Sequential execution
-        if self.param.cores == 1:
-            all_results = [self.run_single(run)
+        if self.param.cores == 1 or self.param.fast_mode:
+            all_results = [_run_single(self.param, run)
                            for run in range(self.param.number_of_runs)]
         # Parallel execution
         else:
-
-            # Check number of cores is valid - must be -1, or between 1 and
-            # total CPUs-1 (saving one for logic control).
-            # Done here rather than in model as this is called before model,
-            # and only relevant for Runner.
-            valid_cores = [-1] + list(range(1, cpu_count()))
-            if self.param.cores not in valid_cores:
-                raise ValueError(
-                    f"Invalid cores: {self.param.cores}. Must be one of: " +
-                    f"{valid_cores}."
-                )
             # Warn users that logging will not run as it is in parallel
             if (
                 self.param.logger.log_to_console or
@@ -192,38 +241,27 @@ class Runner:
                     " If you wish to generate logs, switch to `cores=1`, or " +
                     "just run one replication with `run_single()`."
                 )
-            # Execute replications
-            all_results = Parallel(n_jobs=self.param.cores)(
-                delayed(self.run_single)(run)
+            # Execute replications. Runs are sent to workers in batches, with
+            # the batch size adjusted by joblib so the time spent dispatching
+            # runs is small compared to the time spent running them.
+            all_results = Parallel(
+                n_jobs=self.param.cores, batch_size="auto")(
+                delayed(_run_single)(self.param, run)
                 for run in range(self.param.number_of_runs)
             )
 
-        # Seperate results from each run into appropriate lists
-        patient_results_list = [result["patient"] for result in all_results]
-        run_results_list = [result["run"] for result in all_results]
-        interval_audit_list = [
-            result["interval_audit"] for result in all_results
-        ]
-
-        # Convert lists into dataframes
-        self.patient_results_df = pd.concat(
-            patient_results_list, ignore_index=True
-        )
-        self.run_results_df = pd.DataFrame(run_results_list)
-        self.interval_audit_df = pd.concat(
-            interval_audit_list, ignore_index=True
-        )
-
-        # Calculate average results and uncertainty from across all runs
-        uncertainty_metrics = {}
-        run_col = self.run_results_df.columns
-
-        # Loop through the run performance measure columns
-        # Calculate mean, standard deviation and 95% confidence interval
-        for col in run_col[~run_col.isin(["run_number", "scenario"])]:
-            uncertainty_metrics[col] = dict(zip(
-                ["mean", "std_dev", "lower_95_ci", "upper_95_ci"],
-                summary_stats(self.run_results_df[col])
-            ))
-        # Convert to dataframe
-        self.overall_results_df = pd.DataFrame(uncertainty_metrics)
+        # Join the results from each run into dataframes. The patient-level and
+        # interval audit results are joined column by column, so each
+        # dataframe is built once from a single array per column.
+        self.patient_results_df = pd.DataFrame(concat_columns(
+            [result["patient"] for result in all_results]))
+        self.run_results_df = pd.DataFrame(
+            [result["run"] for result in all_results])
+        self.interval_audit_df = pd.DataFrame(concat_columns(
+            [result["interval_audit"] for result in all_results]))
+
+        # Calculate average results and uncertainty from across all runs -
+        # mean, standard deviation and 95% confidence interval for each of the
+        # run performance measure columns
+        self.overall_results_df = summary_stats_table(
+            self.run_results_df.drop(columns=["run_number", "scenario"]))
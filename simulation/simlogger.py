@@ -67,10 +67,24 @@ class SimLogger:
 
         # If logging enabled (either printing to console, file or both), then
         # create logger and configure settings
-        if self.log_to_console or self.log_to_file:
+        if self.enabled:
             self.logger = logging.getLogger(__name__)
             self._configure_logging()
 
+    @property
+    def enabled(self):
+        """
+        Whether logging is enabled (printing to console, saving to file, or
+        both). Can be checked before composing a message, to avoid the cost
+        of formatting messages which will not be logged.
+
+        Returns
+        -------
+        bool
+            True if log messages will be printed or saved.
+        """
+        return self.log_to_console or self.log_to_file
+
     def _validate_log_path(self):
         """
         Validate the log file path.
@@ -162,15 +176,16 @@ class SimLogger:
         sim_time : float or None, optional
             Current simulation time. If provided, prints before message.
         """
+        if not self.enabled:
+            return
         # Sanitise (if enabled) and pretty format dictionaries
         if isinstance(msg, dict):
             if self.sanitise:
                 msg = {key: self.sanitise_object(value)
                        for key, value in msg.items()}
             msg = pformat(msg, indent=4)
-        if self.log_to_console or self.log_to_file:
-            # Log message, with simulation time rounded to 3dp if given.
-            if sim_time is not None:
-                self.logger.info("%0.3f: %s", sim_time, msg)
-            else:
-                self.logger.info(msg)
+        # Log message, with simulation time rounded to 3dp if given.
+        if sim_time is not None:
+            self.logger.info("%0.3f: %s", sim_time, msg)
+        else:
+            self.logger.info(msg)
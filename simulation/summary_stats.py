@@ -3,7 +3,50 @@ summary_stats.
 """
 
 import numpy as np
-import scipy.stats as st
+import pandas as pd
+from scipy.special import stdtrit  # pylint: disable=no-name-in-module
+
+
+def summary_stats_table(data):
+    """
+    Calculate mean, standard deviation and 95% confidence interval (CI) for
+    every column of a dataframe at once.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data to use in calculation. NaN are ignored.
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe with a column for each column in `data`, and rows for the
+        mean, std_dev, lower_95_ci and upper_95_ci.
+    """
+    # Find number of observations, mean and standard deviation of each column
+    # (if there are no observations, the mean will be NaN)
+    count = data.count()
+    mean = data.mean()
+    std_dev = data.std()
+
+    # Calculation of CI uses t-distribution, which is suitable for smaller
+    # sample sizes (n<30)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        half_width = (stdtrit(count.to_numpy() - 1, 0.975) * std_dev /
+                      np.sqrt(count))
+    # Special case for CI if variance is 0
+    half_width = half_width.mask(std_dev == 0, 0)
+    ci_lower = mean - half_width
+    ci_upper = mean + half_width
+
+    # If there is only one or two observations, can do mean but not others
+    too_few = count < 3
+    return pd.DataFrame({
+        "mean": mean,
+        "std_dev": std_dev.mask(too_few),
+        "lower_95_ci": ci_lower.mask(too_few),
+        "upper_95_ci": ci_upper.mask(too_few)
+    }).T
 
 
 def summary_stats(data):
@@ -13,39 +56,88 @@ def summary_stats(data):
     Parameters
     ----------
     data : pd.Series
-        Data to use in calculation.
+        Data to use in calculation. NaN are ignored.
 
     Returns
     -------
     tuple
         (mean, standard deviation, CI lower, CI upper).
     """
-    # Remove any NaN from the series
-    data = data.dropna()
-
-    # Find number of observations
-    count = len(data)
+    # Remove any NaN and find number of observations
+    values = data.dropna().to_numpy(dtype=float)
+    count = len(values)
 
     # If there are no observations, then set all to NaN
     if count == 0:
-        mean, std_dev, ci_lower, ci_upper = np.nan, np.nan, np.nan, np.nan
+        return np.nan, np.nan, np.nan, np.nan
+
     # If there is only one or two observations, can do mean but not others
-    elif count < 3:
-        mean = data.mean()
-        std_dev, ci_lower, ci_upper = np.nan, np.nan, np.nan
-    # With more than one observation, can calculate all...
+    mean = values.mean()
+    if count < 3:
+        return mean, np.nan, np.nan, np.nan
+
+    # Calculation of CI uses t-distribution, which is suitable for smaller
+    # sample sizes (n<30). Special case for CI if variance is 0.
+    std_dev = values.std(ddof=1)
+    if std_dev == 0:
+        half_width = 0
     else:
-        mean = data.mean()
-        std_dev = data.std()
-        # Special case for CI if variance is 0
-        if np.var(data) == 0:
-            ci_lower, ci_upper = mean, mean
-        else:
-            # Calculation of CI uses t-distribution, which is suitable for
-            # smaller sample sizes (n<30)
-            ci_lower, ci_upper = st.t.interval(
-                confidence=0.95,
-                df=count-1,
-                loc=mean,
-                scale=st.sem(data))
-    return mean, std_dev, ci_lower, ci_upper
+        half_width = stdtrit(count - 1, 0.975) * std_dev / np.sqrt(count)
+    return mean, std_dev, mean - half_width, mean + half_width
+
+
+def cumulative_summary_stats(data, alpha=0.05):
+    """
+    Calculate mean, standard deviation and confidence interval (CI) using
+    the first 1, 2, ..., n values of the data, in a single vectorised pass.
+
+    With the default alpha, each row gives the same results as summary_stats()
+    on the data up to and including that position. The running sum of squared
+    differences from the mean uses the vector form of Welford's update.
+
+    Parameters
+    ----------
+    data : pd.Series
+        Data to use in calculation. NaN are ignored.
+    alpha : float, optional
+        Significance level for the confidence interval (default 0.05, which
+        gives a 95% confidence interval).
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe with a row for each position in `data`, and columns for the
+        mean, std_dev, lower_ci and upper_ci.
+    """
+    # Find the running mean and sum of squared differences from the mean of
+    # the non-NaN values
+    values = data.to_numpy(dtype=float)
+    valid = values[~np.isnan(values)]
+    n = np.arange(1, len(valid) + 1)
+    mean = np.cumsum(valid) / n
+    sq = np.cumsum(
+        (valid - np.concatenate((valid[:1], mean[:-1]))) * (valid - mean))
+
+    # Find the number of observations up to each position, and use it to look
+    # up the running statistics at that position (NaN if no observations)
+    count = np.cumsum(~np.isnan(values))
+    position = np.maximum(count - 1, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(count > 0, np.append(mean, np.nan)[position], np.nan)
+        std_dev = np.sqrt(np.append(sq, np.nan)[position] / (count - 1))
+
+        # Calculation of CI uses t-distribution, which is suitable for smaller
+        # sample sizes (n<30)
+        half_width = (stdtrit(count - 1, 1 - (alpha / 2)) * std_dev /
+                      np.sqrt(count))
+    # Special case for CI if variance is 0
+    half_width = np.where(std_dev == 0, 0, half_width)
+
+    # If there is only one or two observations, can do mean but not others
+    too_few = count < 3
+    return pd.DataFrame({
+        "mean": mean,
+        "std_dev": np.where(too_few, np.nan, std_dev),
+        "lower_ci": np.where(too_few, np.nan, mean - half_width),
+        "upper_ci": np.where(too_few, np.nan, mean + half_width)
+    })
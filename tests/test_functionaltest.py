@@ -20,18 +20,18 @@ def test_negative_results():
     model.run()
     # Check that at least one patient was processed
     error_msg = ("Model should process at least one patient, but processed: " +
-                 f"{len(model.results_list)}.")
-    assert len(model.results_list) > 0, error_msg
+                 f"{len(model.results['patient_id'])}.")
+    assert len(model.results["patient_id"]) > 0, error_msg
     # Check that queue time is non-negative
-    for result in model.results_list:
+    for q_time in model.results["q_time_nurse"]:
         error_msg = ("Nurse queue time should not be negative, but found: " +
-                     f"{result['q_time_nurse']}.")
-        assert result["q_time_nurse"] >= 0, error_msg
+                     f"{q_time}.")
+        assert q_time >= 0, error_msg
     # Check that consultation time is non-negative
-    for result in model.results_list:
+    for time_with_nurse in model.results["time_with_nurse"]:
         error_msg = ("Nurse consultation times should not be negative, but " +
-                     f"found: {result['time_with_nurse']}.")
-        assert result["time_with_nurse"] >= 0, error_msg
+                     f"found: {time_with_nurse}.")
+        assert time_with_nurse >= 0, error_msg
 
 
 def test_high_demand():
@@ -129,12 +129,12 @@ def test_warmup_only():
     assert model.nurse_time_used == 0, error_msg
     # Check that there are no patient results recorded
     error_msg = ("Patient result list should be empty, but found " +
-                 f"{len(model.results_list)} entries.")
-    assert len(model.results_list) == 0, error_msg
+                 f"{len(model.results['patient_id'])} entries.")
+    assert len(model.results["patient_id"]) == 0, error_msg
     # Check that there are no records in interval audit
     error_msg = ("Interval audit list should be empty, but found " +
-                 f"{len(model.audit_list)} entries.")
-    assert len(model.audit_list) == 0, error_msg
+                 f"{len(model.audit_results['simulation_time'])} entries.")
+    assert len(model.audit_results["simulation_time"]) == 0, error_msg
 
 
 def test_warmup_impact():
@@ -386,14 +386,18 @@ def test_parallel():
     assert results["seq"]["run"] == results["par"]["run"]
 
 
+# Any number of cores from total CPUs upwards is invalid, except 1, which is
+# always valid (as the runs are then sequential)
 @pytest.mark.parametrize("cores", [
-    (-2), (0), (cpu_count()), (cpu_count()+1)
+    (-2), (0), (max(cpu_count(), 2)), (max(cpu_count(), 2)+1)
 ])
-def test_valid_cores(cores):
+@pytest.mark.parametrize("fast_mode", [False, True])
+def test_valid_cores(cores, fast_mode):
     """
-    Check there is error handling for input of invalid number of cores.
+    Check there is error handling for input of invalid number of cores,
+    including in fast mode (where replications are always run sequentially).
     """
-    param = Param(cores=cores)
+    param = Param(cores=cores, fast_mode=fast_mode)
     runner = Runner(param)
     with pytest.raises(ValueError):
         runner.run_reps()
@@ -453,11 +457,11 @@ def test_monitoredresource_cleanup():
     # Expected busy time: 12, as one resource busy for the whole simulation
     expected_busy_time = 12.0
     # Run assertions
-    assert sum(resource.area_n_in_queue) == expected_queue_time, (
+    assert resource.area_n_in_queue == expected_queue_time, (
         f"Expected queue time {expected_queue_time} but " +
         f"observed {resource.area_n_in_queue}."
     )
-    assert sum(resource.area_resource_busy) == expected_busy_time, (
+    assert resource.area_resource_busy == expected_busy_time, (
         f"Expected queue time {expected_busy_time} but " +
         f"observed {resource.area_resource_busy}."
     )
@@ -561,3 +565,43 @@ def test_sampled_times():
     assert np.isclose(observed_mean_nur, 8, atol=0.5), (
         f"Expected mean consultation time ≈ 8, but got {observed_mean_nur}."
     )
+
+
+@pytest.mark.parametrize("param_kwargs", [
+    {},
+    {"warm_up_period": 0},
+    {"data_collection_period": 0},
+    {"number_of_nurses": 1, "patient_inter": 0.5},
+    {"number_of_nurses": 1000},
+    {"patient_inter": 2.5, "audit_interval": 33.3, "warm_up_period": 777.7}
+])
+def test_fast_mode(param_kwargs):
+    """
+    Check that Model.run_fast() produces the same results as Model.run().
+
+    Parameters
+    ----------
+    param_kwargs : dict
+        Parameters to change from the defaults used in this test.
+    """
+    results = {}
+    for fast_mode in [False, True]:
+        param = Param(**{"warm_up_period": 500,
+                         "data_collection_period": 1500,
+                         "number_of_runs": 3,
+                         "cores": 1,
+                         **param_kwargs},
+                      fast_mode=fast_mode)
+        experiment = Runner(param)
+        experiment.run_reps()
+        results[fast_mode] = experiment
+    # Verify results are the same
+    pd.testing.assert_frame_equal(results[False].patient_results_df,
+                                  results[True].patient_results_df,
+                                  check_dtype=False)
+    pd.testing.assert_frame_equal(results[False].run_results_df,
+                                  results[True].run_results_df,
+                                  check_dtype=False)
+    pd.testing.assert_frame_equal(results[False].interval_audit_df,
+                                  results[True].interval_audit_df,
+                                  check_dtype=False)
@@ -11,9 +11,11 @@ import logging
 import os
 from unittest.mock import patch, MagicMock
 
+import numpy as np
 import pytest
+from sim_tools.distributions import Exponential
 
-from simulation import Model, Param, SimLogger
+from simulation import BufferedExponential, Model, Param, SimLogger
 
 
 def test_new_attribute():
@@ -27,9 +29,8 @@ def test_new_attribute():
     However, do need to check it is preventing additions after creating class.
     """
     param = Param()
-    with pytest.raises(
-        AttributeError, match="only possible to modify existing attributes"
-    ):
+    with pytest.raises(AttributeError, match="new_entry"):
+        # pylint: disable=assigning-non-slot
         param.new_entry = 3
 
 
@@ -71,6 +72,67 @@ def test_negative_inputs(param_name, value, rule):
         Model(param=param, run_number=0)
 
 
+def test_buffered_exponential():
+    """
+    Check that BufferedExponential returns the same sequence of samples as
+    sampling one at a time from Exponential with the same seed, including
+    across a refill of the buffer, whether using sample_one() or sample().
+    """
+    buffered = BufferedExponential(mean=4, random_seed=42, chunk=10)
+    unbuffered = Exponential(mean=4, random_seed=42)
+    observed = ([buffered.sample_one() for _ in range(15)] +
+                [buffered.sample() for _ in range(10)])
+    expected = [unbuffered.sample() for _ in range(25)]
+    assert np.array_equal(observed, expected), (
+        "Expected BufferedExponential to match Exponential sample-by-sample."
+    )
+
+
+def test_buffer_size_from_run_length():
+    """
+    Check that the model sizes the sample buffers of its distributions from
+    the expected number of patients in the run, so short runs do not draw
+    many more samples than they need.
+    """
+    # pylint: disable=protected-access
+    # Expect 100 arrivals on average, so buffers of 1.2 * 100 + 100 samples
+    param = Param(patient_inter=4, warm_up_period=100,
+                  data_collection_period=300)
+    model = Model(param=param, run_number=0)
+    for dist in [model.patient_inter_arrival_dist,
+                 model.nurse_consult_time_dist]:
+        assert dist._chunk == 220, (
+            f"Expected buffer of 220 samples, but found {dist._chunk}."
+        )
+
+    # Very short runs still have a buffer of at least 100 samples
+    param = Param(warm_up_period=0, data_collection_period=1)
+    model = Model(param=param, run_number=0)
+    assert model.patient_inter_arrival_dist._chunk == 100
+
+
+def test_grow_patient_arrays():
+    """
+    Check that enlarging the patient results arrays keeps the recorded values
+    and fills the new space with NaN.
+    """
+    # pylint: disable=protected-access
+    model = Model(param=Param(), run_number=0)
+    model._grow_patient_arrays(size=2)
+    model._arrival_time[:2] = [1.5, 2.5]
+    model._grow_patient_arrays()
+    assert len(model._arrival_time) == 4, (
+        "Expected patient arrays to double in length when enlarged, but " +
+        f"length is {len(model._arrival_time)}."
+    )
+    assert np.array_equal(model._arrival_time[:2], [1.5, 2.5]), (
+        "Expected recorded arrival times to be kept when arrays are enlarged."
+    )
+    assert np.isnan(model._arrival_time[2:]).all(), (
+        "Expected new space in patient arrays to be filled with NaN."
+    )
+
+
 def test_log_to_console():
     """
     Confirm that logger.log() prints the provided message to the console.
@@ -100,6 +162,18 @@ def test_log_to_file():
                     for handler in logger.logger.handlers))
 
 
+def test_log_disabled():
+    """
+    Confirm that logging is reported as disabled, and that no messages are
+    output, when neither printing to console nor saving to file.
+    """
+    with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        logger = SimLogger()
+        assert not logger.enabled
+        logger.log(sim_time=None, msg="Test console log")
+        assert mock_stdout.getvalue() == ""
+
+
 def test_invalid_path():
     """
     Ensure there is appropriate error handling for an invalid file path.
@@ -116,6 +116,73 @@ def test_onlinestat_computations():
         f"Expected deviation {expected_dev}, got {stats.deviation}")
 
 
+def test_onlinestat_bulk():
+    """
+    Check that initialising OnlineStatistics with an array gives the same
+    statistics as updating it with one value at a time.
+    """
+    values = np.random.default_rng(1).exponential(scale=10, size=100)
+    bulk = OnlineStatistics(data=values)
+    stepwise = OnlineStatistics()
+    for value in values:
+        stepwise.update(value)
+    assert bulk.n == stepwise.n
+    assert bulk.x_i == stepwise.x_i
+    assert np.isclose(bulk.mean, stepwise.mean)
+    assert np.isclose(bulk.variance, stepwise.variance)
+
+
+def test_onlinestat_update_batch():
+    """
+    Check that adding a batch of values to OnlineStatistics which already
+    holds some values gives the same statistics as adding them one at a time.
+    """
+    values = np.random.default_rng(2).exponential(scale=10, size=50)
+    batched = OnlineStatistics(data=values[:20])
+    batched.update_batch(values[20:])
+    stepwise = OnlineStatistics()
+    for value in values:
+        stepwise.update(value)
+    assert batched.n == stepwise.n
+    assert np.isclose(batched.mean, stepwise.mean)
+    assert np.isclose(batched.variance, stepwise.variance)
+
+
+def test_onlinestat_update_batch_observer():
+    """
+    Check that adding a batch of values to OnlineStatistics with an observer
+    attached notifies the observer of each value, so ReplicationTabulizer
+    records one row per value.
+    """
+    values = np.random.default_rng(3).exponential(scale=10, size=10)
+    observer = ReplicationTabulizer()
+    batched = OnlineStatistics(data=values[:4], observer=observer)
+    batched.update_batch(values[4:])
+    assert observer.n == len(values)
+    assert len(observer.summary_table()) == len(values)
+    assert np.allclose(observer.summary_table()["data"], values)
+
+
+def test_onlinestat_summary():
+    """
+    Check that summary() gives the same results as the individual properties,
+    and that both are recalculated after each update.
+    """
+    values = [10, 20, 35, 41]
+    stats = OnlineStatistics()
+    for i, value in enumerate(values):
+        stats.update(value)
+        summary = stats.summary()
+        for name in ["mean", "std", "std_error", "half_width", "lci", "uci",
+                     "deviation"]:
+            np.testing.assert_equal(summary[name], getattr(stats, name))
+        assert np.isclose(summary["mean"], np.mean(values[:i+1]))
+        if i >= 2:
+            assert np.isclose(summary["std"], np.std(values[:i+1], ddof=1))
+        else:
+            assert np.isnan(summary["std"])
+
+
 def test_onlinestat_small():
     """
     Test that OnlineStatistics doesn't return some calculations for small
@@ -159,11 +226,8 @@ def test_tabulizer_update():
     tab = ReplicationTabulizer()
     mock_results = MagicMock()
     mock_results.x_i = 10
-    mock_results.mean = 5.5
-    mock_results.std = 1.2
-    mock_results.lci = 4.8
-    mock_results.uci = 6.2
-    mock_results.deviation = 0.1
+    mock_results.summary.return_value = {
+        "mean": 5.5, "std": 1.2, "lci": 4.8, "uci": 6.2, "deviation": 0.1}
     tab.update(mock_results)
     assert tab.n == 1
     assert tab.x_i == [10]